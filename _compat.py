@@ -0,0 +1,19 @@
+# _compat.py
+
+"""numba가 설치되지 않은 환경을 위한 호환 레이어"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba가 없을 때 함수를 그대로 반환하는 대체 데코레이터"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
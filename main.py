@@ -1,16 +1,18 @@
 # main.py
 
 import numpy as np
-import matplotlib.pyplot as plt
 from no_modifications.robot_model import RobotModel
 from no_modifications.track import Track
 from modifications.path_planner import PathPlanner
 from modifications.controller import Controller
-from math import sqrt
-from visualizer import Visualizer
+from math import hypot
+from visualizer import Visualizer, NullVisualizer
 import json
 import os
+import math
+import time
 from datetime import datetime
+from _compat import njit, HAS_NUMBA
 
 # 설정 파일 경로
 # config_path = 'configs/config_track1.json'
@@ -21,94 +23,126 @@ parser = argparse.ArgumentParser()
 parser.add_argument("config_path", type=str, help="Path to config file")
 args = parser.parse_args()
 config_path = args.config_path
-if check_escape_pressed():
-    print("\n❌ ESC 키 입력됨. 중단 전 상태 저장 중...")
-    real_time = (datetime.now() - start_time).total_seconds()
-    closest_idx = visualizer.find_closest_path_point((robot.x, robot.y), path)
-    progress = (closest_idx / (len(path) - 1)) * 100
-    save_simulation_results(config_path, False, False, simulation_time, progress, real_time)
-    exit(0)
+
+@njit(cache=True, fastmath=True)
+def _check_collision(x, y, yaw, length, width, obstacle_map):
+    """
+    컴파일된 충돌 검사 커널: 첫 충돌 지점에서 바로 반환합니다.
+
+    Returns:
+        tuple: (충돌 여부, 충돌 x, 충돌 y) - 충돌이 없으면 (False, -1, -1)
+    """
+    cos_yaw = math.cos(yaw)
+    sin_yaw = math.sin(yaw)
+    half_length = length / 2
+    half_width = width / 2
+    height_px = obstacle_map.shape[0]
+    width_px = obstacle_map.shape[1]
+
+    # 차량의 네 모서리 좌표 (앞왼쪽 -> 앞오른쪽 -> 뒤오른쪽 -> 뒤왼쪽)
+    corners_x = (x + cos_yaw * half_length - sin_yaw * half_width,
+                 x + cos_yaw * half_length + sin_yaw * half_width,
+                 x - cos_yaw * half_length + sin_yaw * half_width,
+                 x - cos_yaw * half_length - sin_yaw * half_width)
+    corners_y = (y + sin_yaw * half_length + cos_yaw * half_width,
+                 y + sin_yaw * half_length - cos_yaw * half_width,
+                 y - sin_yaw * half_length - cos_yaw * half_width,
+                 y - sin_yaw * half_length + cos_yaw * half_width)
+
+    # 각 변 위의 점들을 순서대로 검사 (i=0이 모서리 점 자체를 포함)
+    for edge in range(4):
+        x0 = corners_x[edge]
+        y0 = corners_y[edge]
+        x1 = corners_x[(edge + 1) % 4]
+        y1 = corners_y[(edge + 1) % 4]
+        for i in range(11):
+            t = i / 10.0
+            px = int(x0 + t * (x1 - x0))
+            py = int(y0 + t * (y1 - y0))
+            if px < 0 or px >= width_px or py < 0 or py >= height_px:
+                return True, px, py
+            if obstacle_map[py, px] == 1:
+                return True, px, py
+    return False, -1, -1
+
+def check_swept_line(x0, y0, x1, y1, obstacle_map):
+    """
+    직전 위치에서 현재 위치까지의 이동 선분만 검사하는 경량 충돌 검사
+
+    전체 박스 검사 사이의 틱에서 사용. 이동 거리에 비례한 개수로 샘플링.
+
+    Returns:
+        tuple: (충돌 여부, 충돌 지점) - 충돌이 없으면 (False, None)
+    """
+    height, width = obstacle_map.shape
+    num_points = int(math.ceil(hypot(x1 - x0, y1 - y0))) + 1
+    for i in range(num_points + 1):
+        t = i / num_points
+        px = int(x0 + t * (x1 - x0))
+        py = int(y0 + t * (y1 - y0))
+        if px < 0 or px >= width or py < 0 or py >= height:
+            return True, (px, py)
+        if obstacle_map[py, px] == 1:
+            return True, (px, py)
+    return False, None
 
 def check_collision(car, obstacle_map, track):
     """
     차량과 장애물 간의 충돌을 확인합니다.
-    차량의 네 모서리와 변을 검사합니다.
-    
+    numba가 있으면 컴파일된 커널로, 없으면 벡터화된 검사로 확인합니다.
+
     Returns:
         tuple: (충돌 여부, 충돌 지점) - 충돌이 없으면 (False, None)
     """
-    # 차량이 차지하는 영역 계산
-    car_length = car.length
-    car_width = car.width
-    
-    # 차량의 네 모서리 좌표 계산
+    if HAS_NUMBA:
+        hit, cx, cy = _check_collision(car.x, car.y, car.yaw,
+                                       car.length, car.width, obstacle_map)
+        if hit:
+            return True, (cx, cy)
+        return False, None
+
+    # 차량의 네 모서리 좌표 계산 (회전 행렬 한 번으로 처리)
     cos_yaw = np.cos(car.yaw)
     sin_yaw = np.sin(car.yaw)
-    
-    corners = [
-        # 앞쪽 왼쪽
-        (car.x + cos_yaw * car_length/2 - sin_yaw * car_width/2,
-         car.y + sin_yaw * car_length/2 + cos_yaw * car_width/2),
-        # 앞쪽 오른쪽
-        (car.x + cos_yaw * car_length/2 + sin_yaw * car_width/2,
-         car.y + sin_yaw * car_length/2 - cos_yaw * car_width/2),
-        # 뒤쪽 왼른쪽
-        (car.x - cos_yaw * car_length/2 + sin_yaw * car_width/2,
-         car.y - sin_yaw * car_length/2 - cos_yaw * car_width/2),
-        # 뒤쪽 왼쪽
-        (car.x - cos_yaw * car_length/2 - sin_yaw * car_width/2,
-         car.y - sin_yaw * car_length/2 + cos_yaw * car_width/2)
-    ]
-    
-    def check_line_segment(start, end, num_points=10):
-        """두 점을 잇는 선분 상의 점들을 검사"""
-        x0, y0 = start
-        x1, y1 = end
-        
-        for i in range(num_points + 1):
-            t = i / num_points
-            x = int(x0 + t * (x1 - x0))
-            y = int(y0 + t * (y1 - y0))
-            
-            if (0 <= x < obstacle_map.shape[1] and 
-                0 <= y < obstacle_map.shape[0]):
-                if obstacle_map[y, x] == 1:
-                    return True, (x, y)
-            else:
-                return True, (x, y)
-        return False, None
-    
-    # 각 모서리 점에서 충돌 검사
-    for corner in corners:
-        x, y = corner
-        check_x = int(x)
-        check_y = int(y)
-        
-        if (0 <= check_x < obstacle_map.shape[1] and 
-            0 <= check_y < obstacle_map.shape[0]):
-            if obstacle_map[check_y, check_x] == 1:
-                return True, corner
-        else:
-            return True, corner
-    
-    # 각 변에서 충돌 검사
-    for i in range(4):
-        start = corners[i]
-        end = corners[(i + 1) % 4]  # 마지막 점은 첫 점과 연결
-        
-        collision, collision_point = check_line_segment(start, end)
-        if collision:
-            return True, collision_point
-    
+    rotation = np.array([[cos_yaw, -sin_yaw],
+                         [sin_yaw, cos_yaw]])
+    offsets = np.array([
+        [car.length/2, car.width/2],    # 앞쪽 왼쪽
+        [car.length/2, -car.width/2],   # 앞쪽 오른쪽
+        [-car.length/2, -car.width/2],  # 뒤쪽 오른쪽
+        [-car.length/2, car.width/2]    # 뒤쪽 왼쪽
+    ])
+    corners = offsets @ rotation.T + np.array([car.x, car.y])
+
+    # 각 변 위의 점들을 브로드캐스팅으로 한 번에 샘플링
+    starts = corners
+    ends = np.roll(corners, -1, axis=0)  # 마지막 점은 첫 점과 연결
+    t = np.linspace(0, 1, 11)[None, :, None]
+    samples = (starts[:, None, :] * (1 - t) + ends[:, None, :] * t).astype(np.int32)
+
+    # 맵 밖으로 나간 점은 충돌로 처리
+    height, width = obstacle_map.shape
+    xs, ys = samples[..., 0], samples[..., 1]
+    in_bounds = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    if not in_bounds.all():
+        edge, i = np.argwhere(~in_bounds)[0]
+        return True, (int(xs[edge, i]), int(ys[edge, i]))
+
+    # 장애물 맵을 한 번의 인덱싱으로 조회
+    hits = obstacle_map[ys, xs] == 1
+    if hits.any():
+        edge, i = np.argwhere(hits)[0]
+        return True, (int(xs[edge, i]), int(ys[edge, i]))
+
     return False, None
 
-def save_simulation_results(config_path, collision, reached_goal, 
+def save_simulation_results(config, collision, reached_goal, 
                           simulation_time, progress, real_time, collision_point=None):
     """
     시뮬레이션 결과를 파일로 저장
     
     Args:
-        config_path (str): 사용된 설정 파일 경로
+        config (dict): 사용된 설정 (main에서 이미 로드한 dict)
         collision (bool): 충돌 여부
         reached_goal (bool): 목표 도달 여부
         simulation_time (float): 시뮬레이션 소요 시간
@@ -126,10 +160,6 @@ def save_simulation_results(config_path, collision, reached_goal,
     config_name = os.path.splitext(os.path.basename(config_path))[0]
     result_filename = f"{config_name}_result_{timestamp}.json"
     
-    # 설정 파일 로드
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    
     # 결과 데이터 구성
     result_data = {
         "configuration": config,
@@ -162,28 +192,29 @@ def main():
         config = json.load(f)
     
     # Track
-    track = Track(config_path)
+    track = Track(config)
     start = track.get_start_point(coord_type='pixel')
     goal = track.get_goal_point(coord_type='pixel')
     
     # Path Planning
-    planner = PathPlanner(track.get_obstacle_map())
+    planner = PathPlanner(track.get_obstacle_map(read_only=True))
     path = planner.find_path(tuple(start), tuple(goal))
     
-    if not path:
+    if path is None or len(path) == 0:
         print("경로를 찾을 수 없습니다.")
         return
-    path = np.array(path)
+    path = np.ascontiguousarray(path, dtype=np.float64)
     
     
     # Robot Model
-    robot = RobotModel(config_path)
+    robot = RobotModel(config)
     
     # Controller
     controller = Controller()
     
-    # Visualizer
-    visualizer = Visualizer()
+    # Visualizer (설정에서 끄면 matplotlib을 로드하지 않는 no-op 구현 사용)
+    use_visualization = config.get('visualization', True)
+    visualizer = Visualizer() if use_visualization else NullVisualizer()
     
     # 시뮬레이션 파라미터
     dt = 0.1
@@ -192,39 +223,64 @@ def main():
     
     # 목표 도달 여부
     reached_goal = False
+
+    # 시각화/전체 충돌 검사 주기 (렌더링이 루프 비용을 지배하므로 분할 상환)
+    VIS_EVERY = 5
+    COLLIDE_FULL_EVERY = 2
+    step = 0
+
+    # 장애물 맵은 루프 내내 바뀌지 않으므로 한 번만 가져와 재사용
+    obstacle_map = np.ascontiguousarray(track.get_obstacle_map(read_only=True),
+                                        dtype=np.uint8)
+
+    # JIT 컴파일 시간이 실행 시간 측정에 섞이지 않도록 미리 워밍업
+    if HAS_NUMBA:
+        _check_collision(robot.x, robot.y, robot.yaw,
+                         robot.length, robot.width, obstacle_map)
+
+    # 시뮬레이션 시작 시간 기록 (단조 증가 타이머)
+    start_time = time.perf_counter()
     
-    # 시뮬레이션 시작 시간 기록
-    start_time = datetime.now()
-    
+    prev_x, prev_y = robot.x, robot.y
+
     while not reached_goal:
         visualizer.update_car_position(robot.x, robot.y)
-        # 진행 상태 출력
-        print(f"Simulation Time: {simulation_time:.2f}s | Robot Position: ({robot.x:.2f}, {robot.y:.2f}) | Velocity: {robot.velocity:.2f} m/s")
+        # 진행 상태 출력 (틱마다 stdout을 플러시하지 않도록 주기 제한)
+        if step % 10 == 0:
+            print(f"Simulation Time: {simulation_time:.2f}s | Robot Position: ({robot.x:.2f}, {robot.y:.2f}) | Velocity: {robot.velocity:.2f} m/s")
         # 목표점 도달 확인 (goal_radius 사용)
-        distance_to_goal = sqrt((robot.x - goal[0])**2 + (robot.y - goal[1])**2)
+        distance_to_goal = hypot(robot.x - goal[0], robot.y - goal[1])
         
         # 충돌 감지 및 시각화
-        collision, collision_point = check_collision(robot, track.get_obstacle_map(), track)
+        # 전체 박스 검사는 COLLIDE_FULL_EVERY 틱마다, 그 사이에는
+        # 직전 위치에서의 이동 선분만 검사
+        if step % COLLIDE_FULL_EVERY == 0:
+            collision, collision_point = check_collision(robot, obstacle_map, track)
+        else:
+            collision, collision_point = check_swept_line(
+                prev_x, prev_y, robot.x, robot.y, obstacle_map)
         if collision:
             print("장애물과 충돌했습니다!")
             print(f"충돌 지점: ({collision_point[0]}, {collision_point[1]})")
             
             visualizer.set_collision_point(collision_point[0], collision_point[1])
-            visualizer.visualize(robot, path, track.get_obstacle_map(), start, goal, 
+            visualizer.visualize(robot, path, obstacle_map, start, goal, 
                                distance_to_goal, simulation_time, goal_radius=goal_radius)
             
             # 실제 실행 시간 계산
-            real_time = (datetime.now() - start_time).total_seconds()
+            real_time = time.perf_counter() - start_time
             
             # 결과 저장
             closest_idx = visualizer.find_closest_path_point((robot.x, robot.y), path)
             progress = (closest_idx / (len(path) - 1)) * 100
             save_simulation_results(
-                config_path, True, False, simulation_time, 
+                config, True, False, simulation_time, 
                 progress, real_time, collision_point
             )
             
-            plt.pause(2)
+            if use_visualization:
+                import matplotlib.pyplot as plt
+                plt.pause(2)
             break
             
         if distance_to_goal < goal_radius:
@@ -232,41 +288,47 @@ def main():
             reached_goal = True
             
             # 실제 실행 시간 계산
-            real_time = (datetime.now() - start_time).total_seconds()
+            real_time = time.perf_counter() - start_time
             
             # 마지막 상태 시각화
-            visualizer.visualize(robot, path, track.get_obstacle_map(), start, goal, 
+            visualizer.visualize(robot, path, obstacle_map, start, goal, 
                                distance_to_goal, simulation_time, force_progress=100.0, 
                                goal_radius=goal_radius)
             
             # 결과 저장  
             save_simulation_results(
-                config_path, False, True, simulation_time, 
+                config, False, True, simulation_time, 
                 100.0, real_time
             )
             break
         
         # Controller 제어 및 속도 제어
-        acceleration, steering_angle = controller.control(robot, path, track.get_obstacle_map(), dt)
+        acceleration, steering_angle = controller.control(robot, path, obstacle_map, dt)
         
         # 차량 상태 업데이트
+        prev_x, prev_y = robot.x, robot.y
         robot.update(acceleration=acceleration, steering_angle=steering_angle, dt=dt)
         
-        # 시각화 업데이트
-        visualizer.visualize(robot, path, track.get_obstacle_map(), start, goal, 
-                           distance_to_goal, simulation_time, goal_radius=goal_radius)
+        # 시각화 업데이트 (VIS_EVERY 틱마다 한 번, 기존 화면 갱신 주기는 유지)
+        if step % VIS_EVERY == 0:
+            visualizer.visualize(robot, path, obstacle_map, start, goal, 
+                               distance_to_goal, simulation_time, update_interval=1, 
+                               goal_radius=goal_radius)
         
         # 시뮬레이션 시간 업데이트
         simulation_time += dt
+        step += 1
     
     # 시뮬레이션 종료 후 최종 상태 표시
-    if collision:
-        plt.title(f"Simulation ended: Collision detected! (Time: {simulation_time:.1f}s)", 
-                 color='red', fontsize=15)
-    elif reached_goal:
-        plt.title(f"Simulation ended: Goal reached! (Time: {simulation_time:.1f}s)", 
-                 color='green', fontsize=15)
-    
+    if use_visualization:
+        import matplotlib.pyplot as plt
+        if collision:
+            plt.title(f"Simulation ended: Collision detected! (Time: {simulation_time:.1f}s)",
+                     color='red', fontsize=15)
+        elif reached_goal:
+            plt.title(f"Simulation ended: Goal reached! (Time: {simulation_time:.1f}s)",
+                     color='green', fontsize=15)
+
     visualizer.show()
     
 if __name__ == "__main__":
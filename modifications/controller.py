@@ -1,5 +1,8 @@
+import math
+
 import numpy as np
 from scipy.interpolate import splprep, splev
+from scipy.spatial import cKDTree
 
 class Controller:
     def __init__(self, k=1.0, k_soft=0.5, max_speed=30.0, resolution=0.3):
@@ -18,6 +21,10 @@ class Controller:
         self.integral_error = 0.0
         self.previous_cross_track_error = 0.0
         self.previous_steering_angle = 0.0
+        self._path_arr = None  # 경로를 ndarray로 변환한 캐시
+        self._seg_dirs = None  # 경로 각 구간의 단위 방향 벡터 (사전 계산)
+        self._tree = None  # 전역 최근접 탐색용 KD-트리
+        self._last_idx = 0  # 직전 틱의 최근접 경로 인덱스 (윈도우 탐색 기준점)
 
     def control(self, robot, path, obstacle_map, dt):
         """
@@ -30,11 +37,23 @@ class Controller:
         Returns:
             acceleration, steering_angle: 가속도와 조향각
         """
+        # 경로를 한 번만 ndarray로 변환하고 구간별 방향을 사전 계산해 캐시
+        # (경로는 시뮬레이션 내내 고정이므로 이후 틱에서는 배열 로드만 발생)
+        if self._path_arr is None or self._path_arr.shape[0] != len(path):
+            self._path_arr = np.asarray(path, dtype=np.float64)
+            diffs = np.diff(self._path_arr, axis=0)
+            norms = np.linalg.norm(diffs, axis=1, keepdims=True)
+            seg_dirs = diffs / np.maximum(norms, 1e-12)
+            self._seg_dirs = np.vstack([seg_dirs, seg_dirs[-1:]])
+            self._tree = cKDTree(self._path_arr)
+            self._last_idx = 0
+        path = self._path_arr
+
         current_pos = np.array([robot.x, robot.y])
         closest_idx, closest_point = self.find_closest_point(current_pos, path)
 
         # 헤딩 오류와 크로스 트랙 오류 계산
-        heading_error = self.calculate_heading_error(robot, path, look_ahead_base=5)
+        heading_error = self.calculate_heading_error(robot, path, closest_idx, look_ahead_base=5)
         cross_track_error = self.calculate_cross_track_error(robot, closest_point, path, closest_idx)
 
         # I-Term과 D-Term (적분 및 미분 항)
@@ -42,20 +61,22 @@ class Controller:
         cross_track_error_derivative = (cross_track_error - self.previous_cross_track_error) / dt
         self.previous_cross_track_error = cross_track_error
 
-        # Stanley 조향각 계산 및 속도 기반 보정
-        raw_steering_angle = heading_error + np.arctan2(
+        # Stanley 조향각 계산 및 속도 기반 보정 (스칼라는 math로 처리)
+        raw_steering_angle = heading_error + math.atan2(
             self.k * cross_track_error + 0.1 * self.integral_error + 0.1 * cross_track_error_derivative,
             (robot.velocity + self.k_soft)
         )
 
         # 속도 감속 (조향각에 비례하여 속도를 줄임)
-        steering_ratio = abs(raw_steering_angle) / np.radians(45)  # 조향각이 45도 기준
+        steering_ratio = abs(raw_steering_angle) / math.radians(45)  # 조향각이 45도 기준
         speed = max(self.max_speed * (1 - 2.0 * steering_ratio), 5.0)  # 속도 비율 조절
         acceleration = (speed - robot.velocity) / dt
 
-        # 전체 가속도와 조향각 제한
-        acceleration = np.clip(acceleration, -robot.max_acceleration / 2, robot.max_acceleration / 2)
-        steering_angle = np.clip(raw_steering_angle, -robot.max_steering_angle, robot.max_steering_angle)
+        # 전체 가속도와 조향각 제한 (스칼라 min/max)
+        a_max = robot.max_acceleration / 2
+        s_max = robot.max_steering_angle
+        acceleration = min(max(acceleration, -a_max), a_max)
+        steering_angle = min(max(raw_steering_angle, -s_max), s_max)
 
         # 이전 조향각 업데이트
         self.previous_steering_angle = steering_angle
@@ -66,32 +87,47 @@ class Controller:
     def find_closest_point(self, current_pos, path):
         """
         경로에서 가장 가까운 점을 찾음
+
+        차량은 경로를 따라 단조롭게 진행하므로 직전 인덱스 주변의 좁은
+        윈도우만 먼저 탐색하고(O(1)), 윈도우 경계에 걸린 경우에만
+        KD-트리로 전역 탐색(O(log N))으로 폴백함
         """
-        distances = [np.linalg.norm(current_pos - np.array(p)) for p in path]
-        closest_idx = int(np.argmin(distances))
+        lo = max(0, self._last_idx - 5)
+        hi = min(len(path), self._last_idx + 50)
+        diff = path[lo:hi] - current_pos
+        d2 = np.einsum('ij,ij->i', diff, diff)  # sqrt 없이 제곱 거리로 비교
+        local_idx = int(np.argmin(d2))
+        closest_idx = lo + local_idx
+
+        # 윈도우 가장자리가 최솟값이면 진짜 최근접이 밖에 있을 수 있음
+        if (local_idx == 0 and lo > 0) or (local_idx == hi - lo - 1 and hi < len(path)):
+            closest_idx = int(self._tree.query(current_pos)[1])
+
+        self._last_idx = closest_idx
         return closest_idx, path[closest_idx]
 
     def calculate_cross_track_error(self, robot, closest_point, path, closest_idx):
         """
-        크로스 트랙 오류 계산
+        크로스 트랙 오류 계산 (사전 계산된 단위 방향 벡터와의 2D 외적)
         """
-        next_point = path[min(closest_idx + 1, len(path) - 1)]
-        path_vector = np.array(next_point) - np.array(closest_point)
-        robot_vector = np.array([robot.x, robot.y]) - np.array(closest_point)
-        return np.cross(path_vector, robot_vector) / np.linalg.norm(path_vector)
+        seg_dir = self._seg_dirs[closest_idx]
+        rel_x = robot.x - closest_point[0]
+        rel_y = robot.y - closest_point[1]
+        return seg_dir[0] * rel_y - seg_dir[1] * rel_x
 
-    def calculate_heading_error(self, robot, path, look_ahead_base=7):
+    def calculate_heading_error(self, robot, path, closest_idx, look_ahead_base=7):
         """
         동적 Look-Ahead Distance를 사용해 헤딩 오류를 계산
+
+        control()에서 이미 구한 closest_idx를 받아 경로 전체에 대한
+        argmin을 틱마다 두 번 수행하던 중복을 제거함
         """
         look_ahead = look_ahead_base + int(robot.velocity / 10.0)  # 속도에 비례해 증가
         look_ahead = min(look_ahead, 15)  # 최대 제한
 
-        distances = np.linalg.norm(path - np.array([robot.x, robot.y]), axis=1)
-        closest_idx = np.argmin(distances)
         future_idx = min(closest_idx + look_ahead, len(path) - 1)
         future_point = path[future_idx]
 
-        target_heading = np.arctan2(future_point[1] - robot.y, future_point[0] - robot.x)
+        target_heading = math.atan2(future_point[1] - robot.y, future_point[0] - robot.x)
         heading_error = target_heading - robot.yaw
-        return np.arctan2(np.sin(heading_error), np.cos(heading_error))
+        return math.atan2(math.sin(heading_error), math.cos(heading_error))
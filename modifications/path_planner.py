@@ -1,23 +1,416 @@
+import math
+
 import numpy as np
 import heapq
 from scipy.ndimage import distance_transform_edt
 from scipy.interpolate import splprep, splev
 
+from _compat import njit, HAS_NUMBA
+
+SQRT2 = math.sqrt(2.0)
+SQRT2_M1 = SQRT2 - 1.0  # 옥타일 거리의 대각 보정 계수
+
+# 8방향 탐색 오프셋 (축 방향 4개 + 대각 방향 4개)
+DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0),
+        (1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+@njit(cache=True)
+def _octile(x1, y1, x2, y2):
+    """
+    8방향 격자에서 허용 가능하면서 가장 타이트한 옥타일 거리 휴리스틱
+    """
+    dx = abs(x1 - x2)
+    dy = abs(y1 - y2)
+    if dx < dy:
+        return dy + SQRT2_M1 * dx
+    return dx + SQRT2_M1 * dy
+
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_id, size, f, pid):
+    """배열 기반 이진 힙에 (f, pid) 삽입 후 새 크기 반환"""
+    i = size
+    heap_f[i] = f
+    heap_id[i] = pid
+    while i > 0:
+        parent = (i - 1) // 2
+        if heap_f[parent] <= heap_f[i]:
+            break
+        heap_f[parent], heap_f[i] = heap_f[i], heap_f[parent]
+        heap_id[parent], heap_id[i] = heap_id[i], heap_id[parent]
+        i = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_id, size):
+    """배열 기반 이진 힙에서 최솟값 제거 후 (f, pid, 새 크기) 반환"""
+    top_f = heap_f[0]
+    top_id = heap_id[0]
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_id[0] = heap_id[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < size and heap_f[left] < heap_f[smallest]:
+            smallest = left
+        if right < size and heap_f[right] < heap_f[smallest]:
+            smallest = right
+        if smallest == i:
+            break
+        heap_f[smallest], heap_f[i] = heap_f[i], heap_f[smallest]
+        heap_id[smallest], heap_id[i] = heap_id[i], heap_id[smallest]
+        i = smallest
+    return top_f, top_id, size
+
+
+@njit(cache=True)
+def _expand(current, cols, safe_mask, inv_dist, g_score, came_from,
+            heap_f, heap_id, heap_size, tx, ty):
+    """
+    한 방향 탐색에서 current의 이웃들을 이완(relax)하고 새 힙 크기를 반환
+
+    safe_mask/inv_dist는 0으로 패딩된 배열이므로 경계 검사가 필요 없음.
+    (tx, ty)는 해당 방향의 목표점으로 휴리스틱 계산에만 사용됨
+    """
+    cy = current // cols
+    cx = current - cy * cols
+    prev = came_from[current]
+    g_current = g_score[current]
+
+    for dx, dy in DIRS:
+        nx = cx + dx
+        ny = cy + dy
+        if safe_mask[ny, nx] == 0:
+            continue
+
+        neighbor = ny * cols + nx
+
+        # 중앙을 더 선호하도록 비용 추가 (미리 역수를 취한 값 로드)
+        distance_weight = inv_dist[ny, nx]
+
+        # 곡률 기반 비용: 급격한 방향 전환을 방지
+        # atan2(cross, dot)은 acos(dot/(|a||b|)) 형태와 같은 각도를
+        # sqrt/클램핑 없이 안정적으로 계산함
+        curvature_penalty = 0.0
+        if prev >= 0:
+            py = prev // cols
+            px = prev - py * cols
+            v1x = float(cx - px)
+            v1y = float(cy - py)
+            v2x = float(dx)
+            v2y = float(dy)
+            angle = math.atan2(v1x * v2y - v1y * v2x, v1x * v2x + v1y * v2y)
+            curvature_penalty = abs(angle) * 5.0
+
+        # 대각 이동은 sqrt(2) 비용으로 휴리스틱과 단위를 맞춤
+        step_cost = SQRT2 if dx != 0 and dy != 0 else 1.0
+        tentative_g_score = g_current + step_cost + distance_weight + curvature_penalty
+
+        if tentative_g_score < g_score[neighbor]:
+            came_from[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            f = tentative_g_score + _octile(nx, ny, tx, ty)
+            heap_size = _heap_push(heap_f, heap_id, heap_size, f, neighbor)
+    return heap_size
+
+
+@njit(cache=True)
+def _astar(safe_mask, inv_dist, sx, sy, gx, gy):
+    """
+    양방향 A* 탐색 커널 (0으로 패딩된 safe_mask/inv_dist 기준 좌표계)
+
+    시작점과 목표점에서 동시에 탐색을 진행하고 두 프런티어가 만나면
+    종료함. g_score/came_from은 방향별 flat 배열, 힙은 방향별 배열 쌍으로
+    관리하여 numba로 컴파일 가능하게 함.
+
+    Returns:
+        ndarray: (K, 2) 경로 좌표 (x, y), 실패 시 (0, 2)
+    """
+    rows, cols = safe_mask.shape
+    n = rows * cols
+
+    g_fwd = np.full(n, np.inf, np.float32)
+    g_bwd = np.full(n, np.inf, np.float32)
+    from_fwd = np.full(n, -1, np.int32)
+    from_bwd = np.full(n, -1, np.int32)
+    closed_fwd = np.zeros(n, np.uint8)
+    closed_bwd = np.zeros(n, np.uint8)
+
+    # 확장당 최대 8번 push되므로 상한 크기로 한 번에 할당
+    heap_ff = np.empty(8 * n + 8, np.float32)
+    heap_fi = np.empty(8 * n + 8, np.int32)
+    heap_bf = np.empty(8 * n + 8, np.float32)
+    heap_bi = np.empty(8 * n + 8, np.int32)
+    size_f = 0
+    size_b = 0
+
+    start_pid = sy * cols + sx
+    goal_pid = gy * cols + gx
+    g_fwd[start_pid] = 0.0
+    g_bwd[goal_pid] = 0.0
+    size_f = _heap_push(heap_ff, heap_fi, size_f, _octile(sx, sy, gx, gy), start_pid)
+    size_b = _heap_push(heap_bf, heap_bi, size_b, _octile(gx, gy, sx, sy), goal_pid)
+
+    best_meet = -1
+    best_meet_cost = np.inf
+
+    while size_f > 0 and size_b > 0:
+        # 두 프런티어의 하한 합이 현재 최적 만남 비용 이상이면 종료
+        if heap_ff[0] + heap_bf[0] >= best_meet_cost:
+            break
+
+        if heap_ff[0] <= heap_bf[0]:
+            # 정방향 확장
+            _, current, size_f = _heap_pop(heap_ff, heap_fi, size_f)
+            if closed_fwd[current] == 1:
+                continue
+            closed_fwd[current] = 1
+
+            if g_bwd[current] < np.inf:
+                total = g_fwd[current] + g_bwd[current]
+                if total < best_meet_cost:
+                    best_meet_cost = total
+                    best_meet = current
+
+            size_f = _expand(current, cols, safe_mask, inv_dist,
+                             g_fwd, from_fwd, heap_ff, heap_fi, size_f, gx, gy)
+        else:
+            # 역방향 확장
+            _, current, size_b = _heap_pop(heap_bf, heap_bi, size_b)
+            if closed_bwd[current] == 1:
+                continue
+            closed_bwd[current] = 1
+
+            if g_fwd[current] < np.inf:
+                total = g_fwd[current] + g_bwd[current]
+                if total < best_meet_cost:
+                    best_meet_cost = total
+                    best_meet = current
+
+            size_b = _expand(current, cols, safe_mask, inv_dist,
+                             g_bwd, from_bwd, heap_bf, heap_bi, size_b, sx, sy)
+
+    if best_meet < 0:
+        return np.empty((0, 2), np.int32)
+
+    # 경로 재구성: 만남점에서 시작점 방향(from_fwd)과 목표점 방향(from_bwd)으로
+    # 각각 걸어가서 이어붙임
+    length_f = 0
+    pid = best_meet
+    while pid >= 0:
+        length_f += 1
+        pid = from_fwd[pid]
+
+    length_b = 0
+    pid = from_bwd[best_meet]
+    while pid >= 0:
+        length_b += 1
+        pid = from_bwd[pid]
+
+    path = np.empty((length_f + length_b, 2), np.int32)
+    pid = best_meet
+    for i in range(length_f - 1, -1, -1):
+        py = pid // cols
+        path[i, 0] = pid - py * cols
+        path[i, 1] = py
+        pid = from_fwd[pid]
+
+    pid = from_bwd[best_meet]
+    for i in range(length_f, length_f + length_b):
+        py = pid // cols
+        path[i, 0] = pid - py * cols
+        path[i, 1] = py
+        pid = from_bwd[pid]
+    return path
+
+
+@njit(cache=True)
+def _jump_straight(safe_mask, x, y, dx, dy, gx, gy):
+    """
+    축 방향 점프: 장애물(-1, -1), 목표점, 강제 이웃이 나올 때까지 직진
+    """
+    while True:
+        x += dx
+        y += dy
+        if safe_mask[y, x] == 0:
+            return -1, -1
+        if x == gx and y == gy:
+            return x, y
+        if dx != 0:
+            # 옆 칸이 막혀 있는데 그 대각 앞 칸이 열려 있으면 강제 이웃
+            if (safe_mask[y + 1, x + dx] != 0 and safe_mask[y + 1, x] == 0) or \
+               (safe_mask[y - 1, x + dx] != 0 and safe_mask[y - 1, x] == 0):
+                return x, y
+        else:
+            if (safe_mask[y + dy, x + 1] != 0 and safe_mask[y, x + 1] == 0) or \
+               (safe_mask[y + dy, x - 1] != 0 and safe_mask[y, x - 1] == 0):
+                return x, y
+
+
+@njit(cache=True)
+def _jump(safe_mask, x, y, dx, dy, gx, gy):
+    """
+    (dx, dy) 방향으로 점프 포인트를 찾음 (없으면 (-1, -1))
+
+    대각 이동은 한 칸 전진할 때마다 두 축 성분을 각각 직선 스캔해
+    점프 포인트가 보이면 현재 칸을 점프 포인트로 반환함
+    """
+    if dx == 0 or dy == 0:
+        return _jump_straight(safe_mask, x, y, dx, dy, gx, gy)
+
+    while True:
+        x += dx
+        y += dy
+        if safe_mask[y, x] == 0:
+            return -1, -1
+        if x == gx and y == gy:
+            return x, y
+        if (safe_mask[y + dy, x - dx] != 0 and safe_mask[y, x - dx] == 0) or \
+           (safe_mask[y - dy, x + dx] != 0 and safe_mask[y - dy, x] == 0):
+            return x, y
+        tx, _ = _jump_straight(safe_mask, x, y, dx, 0, gx, gy)
+        if tx >= 0:
+            return x, y
+        tx, _ = _jump_straight(safe_mask, x, y, 0, dy, gx, gy)
+        if tx >= 0:
+            return x, y
+
+
+@njit(cache=True)
+def _jps(safe_mask, sx, sy, gx, gy):
+    """
+    균일 비용 8방향 격자용 Jump Point Search 커널
+
+    직선 구간을 점프 포인트 단위로 건너뛰어 힙에 들어가는 노드 수를
+    크게 줄임. 중앙 선호/곡률 비용은 반영하지 않음.
+
+    Returns:
+        ndarray: (K, 2) 한 칸 간격으로 보간된 경로 좌표, 실패 시 (0, 2)
+    """
+    rows, cols = safe_mask.shape
+    n = rows * cols
+
+    g_score = np.full(n, np.inf, np.float32)
+    came_from = np.full(n, -1, np.int32)
+    closed = np.zeros(n, np.uint8)
+
+    heap_f = np.empty(8 * n + 8, np.float32)
+    heap_id = np.empty(8 * n + 8, np.int32)
+    heap_size = 0
+
+    start_pid = sy * cols + sx
+    goal_pid = gy * cols + gx
+    g_score[start_pid] = 0.0
+    heap_size = _heap_push(heap_f, heap_id, heap_size,
+                           _octile(sx, sy, gx, gy), start_pid)
+
+    found = False
+    while heap_size > 0:
+        _, current, heap_size = _heap_pop(heap_f, heap_id, heap_size)
+
+        if closed[current] == 1:
+            continue
+        closed[current] = 1
+
+        if current == goal_pid:
+            found = True
+            break
+
+        cy = current // cols
+        cx = current - cy * cols
+
+        for dx, dy in DIRS:
+            jx, jy = _jump(safe_mask, cx, cy, dx, dy, gx, gy)
+            if jx < 0:
+                continue
+            jpid = jy * cols + jx
+            if closed[jpid] == 1:
+                continue
+            ddx = float(jx - cx)
+            ddy = float(jy - cy)
+            tentative_g_score = g_score[current] + math.sqrt(ddx * ddx + ddy * ddy)
+            if tentative_g_score < g_score[jpid]:
+                came_from[jpid] = current
+                g_score[jpid] = tentative_g_score
+                f = tentative_g_score + _octile(jx, jy, gx, gy)
+                heap_size = _heap_push(heap_f, heap_id, heap_size, f, jpid)
+
+    if not found:
+        return np.empty((0, 2), np.int32)
+
+    # 점프 포인트 개수와 펼친 경로 길이(체비쇼프 거리 합)를 먼저 계산
+    num_jumps = 0
+    pid = goal_pid
+    while pid >= 0:
+        num_jumps += 1
+        pid = came_from[pid]
+
+    jumps = np.empty((num_jumps, 2), np.int32)
+    pid = goal_pid
+    for i in range(num_jumps - 1, -1, -1):
+        py = pid // cols
+        jumps[i, 0] = pid - py * cols
+        jumps[i, 1] = py
+        pid = came_from[pid]
+
+    length = 1
+    for i in range(1, num_jumps):
+        length += max(abs(jumps[i, 0] - jumps[i - 1, 0]),
+                      abs(jumps[i, 1] - jumps[i - 1, 1]))
+
+    # 점프 포인트 사이를 한 칸씩 보간 (같은 직선 위에 있으므로 부호 이동)
+    path = np.empty((length, 2), np.int32)
+    path[0, 0] = jumps[0, 0]
+    path[0, 1] = jumps[0, 1]
+    k = 1
+    for i in range(1, num_jumps):
+        x = jumps[i - 1, 0]
+        y = jumps[i - 1, 1]
+        steps = max(abs(jumps[i, 0] - x), abs(jumps[i, 1] - y))
+        step_x = (jumps[i, 0] - x) // steps if steps > 0 else 0
+        step_y = (jumps[i, 1] - y) // steps if steps > 0 else 0
+        for _ in range(steps):
+            x += step_x
+            y += step_y
+            path[k, 0] = x
+            path[k, 1] = y
+            k += 1
+    return path
+
+
 class PathPlanner:
-    def __init__(self, obstacle_map, robot_size=5.0, safety_margin=6.0):
+    def __init__(self, obstacle_map, robot_size=5.0, safety_margin=6.0, use_jps=False):
         """
         경로 계획 초기화
         Args:
             obstacle_map (ndarray): 장애물 맵
             robot_size (float): 로봇의 크기
             safety_margin (float): 장애물과의 안전 마진
+            use_jps (bool): True면 균일 비용 Jump Point Search 사용
+                (훨씬 적은 노드를 확장하지만 중앙 선호/곡률 비용은 무시됨)
         """
-        self.obstacle_map = obstacle_map
+        self.obstacle_map = np.ascontiguousarray(obstacle_map, dtype=np.uint8)
         self.robot_size = robot_size
         self.safety_margin = safety_margin
+        self.use_jps = use_jps
         self.distance_map = self._generate_distance_map()
         self.safe_mask = self._generate_safe_mask()
 
+        # 탐색 커널용 사전 계산 배열:
+        # - 0으로 채운 1픽셀 테두리를 두른 safe_mask (내부 루프의 경계 검사 제거)
+        # - 나눗셈 대신 한 번의 로드로 끝나도록 미리 역수를 취한 거리 맵
+        rows, cols = self.safe_mask.shape
+        self._safe_padded = np.zeros((rows + 2, cols + 2), np.uint8)
+        self._safe_padded[1:-1, 1:-1] = self.safe_mask
+        self._inv_dist_padded = np.zeros((rows + 2, cols + 2), np.float32)
+        self._inv_dist_padded[1:-1, 1:-1] = 1.0 / (self.distance_map + 1e-6)
+
     def _generate_distance_map(self):
         """
         거리 변환 맵 생성: 각 지점에서 장애물까지의 거리 계산
@@ -26,122 +419,132 @@ class PathPlanner:
 
     def _generate_safe_mask(self):
         """
-        안전 마진을 반영한 이동 가능한 영역 생성
+        안전 마진을 반영한 이동 가능한 영역 생성 (C-연속 uint8)
         """
-        return self.distance_map > (self.robot_size + self.safety_margin)
+        mask = self.distance_map > (self.robot_size + self.safety_margin)
+        return np.ascontiguousarray(mask.astype(np.uint8))
 
     def find_path(self, start, goal):
         """
         A* 알고리즘을 사용하여 시작점에서 목표점까지 경로 생성
+
+        numba가 있으면 컴파일된 커널(_astar)로, 없으면 기존 파이썬 루프로 탐색
+        """
+        if HAS_NUMBA:
+            # 패딩된 좌표계(+1)로 탐색하고 결과를 원래 좌표계로 되돌림
+            if self.use_jps:
+                raw_path = _jps(
+                    self._safe_padded,
+                    int(start[0]) + 1, int(start[1]) + 1,
+                    int(goal[0]) + 1, int(goal[1]) + 1
+                )
+            else:
+                raw_path = _astar(
+                    self._safe_padded, self._inv_dist_padded,
+                    int(start[0]) + 1, int(start[1]) + 1,
+                    int(goal[0]) + 1, int(goal[1]) + 1
+                )
+            if raw_path.shape[0] == 0:
+                return None
+            path = [(int(x) - 1, int(y) - 1) for x, y in raw_path]
+        else:
+            path = self._find_path_py(start, goal)
+            if path is None:
+                return None
+
+        return self._smooth(path, s=0.3)  # 보간 + 스무딩을 한 번에
+
+    def _find_path_py(self, start, goal):
         """
-        rows, cols = self.obstacle_map.shape
+        numba가 없을 때 사용하는 파이썬 A* 탐색
+
+        dict/set 대신 선형 픽셀 id(pid = y*cols + x)로 인덱싱하는 flat 배열을
+        사용해 튜플 해싱과 힙 내 튜플 비교 비용을 제거함
+        """
+        safe_mask = self._safe_padded
+        inv_dist = self._inv_dist_padded
+        rows, cols = safe_mask.shape
+        n = rows * cols
+        g_score = np.full(n, np.inf, np.float32)
+        came_from = np.full(n, -1, np.int32)
+        closed = np.zeros(n, np.bool_)
+
+        # 패딩된 좌표계(+1)에서 탐색
+        sx, sy = int(start[0]) + 1, int(start[1]) + 1
+        gx, gy = int(goal[0]) + 1, int(goal[1]) + 1
+        start_pid = sy * cols + sx
+        goal_pid = gy * cols + gx
+        g_score[start_pid] = 0.0
+
         open_set = []
-        heapq.heappush(open_set, (0, start))
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: self.heuristic(start, goal)}
-        visited = set()
+        heapq.heappush(open_set, (_octile(sx, sy, gx, gy), start_pid))
 
         while open_set:
             _, current = heapq.heappop(open_set)
 
-            if current in visited:
+            if closed[current]:
                 continue
-            visited.add(current)
+            closed[current] = True
 
             # 목표점에 도달하면 경로 재구성
-            if current == goal:
-                path = self.reconstruct_path(came_from, start, goal)
-                path = self.interpolate_path(path, resolution=0.5)  # 경로 간격 조정
-                path = self.smooth_path(path, smoothing_factor=0.3)  # 스무딩 강화
-                return path
-
-            for neighbor in self.get_neighbors(current, rows, cols):
-                if not self.is_valid_point(neighbor):
+            if current == goal_pid:
+                path = []
+                pid = goal_pid
+                while pid >= 0:
+                    y, x = divmod(pid, cols)
+                    path.append((x - 1, y - 1))
+                    pid = came_from[pid]
+                return path[::-1]
+
+            cy, cx = divmod(current, cols)
+            prev = came_from[current]
+            g_current = g_score[current]
+
+            for dx, dy in DIRS:
+                nx, ny = cx + dx, cy + dy
+                if not safe_mask[ny, nx]:
                     continue
 
-                # 중앙을 더 선호하도록 비용 추가
-                distance_weight = 1 / (self.distance_map[neighbor[1], neighbor[0]] + 1e-6)
-                curvature_penalty = self.curvature_cost(current, neighbor, came_from)
-                tentative_g_score = g_score[current] + 1 + distance_weight + curvature_penalty
+                neighbor = ny * cols + nx
+
+                # 중앙을 더 선호하도록 비용 추가 (미리 역수를 취한 값 로드)
+                distance_weight = inv_dist[ny, nx]
+
+                # 곡률 기반 비용: 급격한 방향 전환을 방지
+                curvature_penalty = 0.0
+                if prev >= 0:
+                    py, px = divmod(int(prev), cols)
+                    v1x, v1y = cx - px, cy - py
+                    angle = math.atan2(v1x * dy - v1y * dx, v1x * dx + v1y * dy)
+                    curvature_penalty = abs(angle) * 5  # 곡률 비용 가중치
 
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                # 대각 이동은 sqrt(2) 비용으로 휴리스틱과 단위를 맞춤
+                step_cost = SQRT2 if dx != 0 and dy != 0 else 1.0
+                tentative_g_score = g_current + step_cost + distance_weight + curvature_penalty
+
+                if tentative_g_score < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self.heuristic(neighbor, goal)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    f = tentative_g_score + _octile(nx, ny, gx, gy)
+                    heapq.heappush(open_set, (f, neighbor))
         return None
 
-    def heuristic(self, a, b):
-        """
-        유클리드 거리 기반 휴리스틱 계산
-        """
-        return np.linalg.norm(np.array(a) - np.array(b))
-
-    def get_neighbors(self, point, rows, cols):
-        """
-        인접한 점 반환 (8방향 탐색)
+    def _smooth(self, path, s=0.3, samples_per_unit=8.0):
         """
-        x, y = point
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1)]
-        return [(x + dx, y + dy) for dx, dy in directions if 0 <= x + dx < cols and 0 <= y + dy < rows]
+        B-Spline 한 번으로 경로 보간과 스무딩을 동시에 수행
 
-    def is_valid_point(self, point):
-        """
-        주어진 좌표가 안전한 영역인지 검사
-        """
-        x, y = int(point[0]), int(point[1])
-        return self.safe_mask[y, x]
+        splprep가 임의 샘플 밀도를 지원하므로 별도의 파이썬 보간 루프 없이
+        곡선 길이에 비례한 개수로 바로 샘플링함
 
-    def curvature_cost(self, current, neighbor, came_from):
-        """
-        곡률 기반 비용: 급격한 방향 전환을 방지
-        """
-        if current in came_from:
-            prev = came_from[current]
-            vec1 = np.array(current) - np.array(prev)
-            vec2 = np.array(neighbor) - np.array(current)
-            angle = np.arccos(
-                np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2) + 1e-6)
-            )
-            return abs(angle) * 5  # 곡률 비용 가중치
-        return 0
-
-    def reconstruct_path(self, came_from, start, goal):
-        """
-        경로 재구성
-        """
-        path = []
-        current = goal
-        while current != start:
-            path.append(current)
-            current = came_from[current]
-        path.append(start)
-        return path[::-1]
-
-    def interpolate_path(self, path, resolution=0.3):
-        """
-        경로 보간: 점 간 간격을 일정하게 만듦
-        """
-        interpolated_path = [path[0]]
-        for i in range(1, len(path)):
-            p1, p2 = np.array(path[i - 1]), np.array(path[i])
-            distance = np.linalg.norm(p2 - p1)
-            num_points = max(1, int(distance / resolution))
-            for j in range(1, num_points + 1):
-                new_point = p1 + (p2 - p1) * (j / num_points)
-                interpolated_path.append(tuple(new_point))
-        return interpolated_path
-
-    def smooth_path(self, path, smoothing_factor=0.3):
-        """
-        B-Spline을 사용해 경로를 부드럽게 만듦
+        Returns:
+            ndarray: (N, 2) 스무딩된 경로
         """
+        path = np.asarray(path, dtype=np.float64)
         if len(path) < 3:
             return path
-        path = np.array(path)
-        x, y = path[:, 0], path[:, 1]
-        tck, u = splprep([x, y], s=smoothing_factor)
-        u_new = np.linspace(0, 1, len(path) * 5)
+        tck, u = splprep([path[:, 0], path[:, 1]], s=s, k=min(3, len(path) - 1))
+        total_len = np.sum(np.linalg.norm(np.diff(path, axis=0), axis=1))
+        n = max(len(path), int(total_len * samples_per_unit))
+        u_new = np.linspace(0, 1, n)
         x_new, y_new = splev(u_new, tck)
-        return list(zip(x_new, y_new))
+        return np.column_stack([x_new, y_new])
@@ -1,18 +1,73 @@
+import math
+
 import numpy as np
 import json
 
+from _compat import njit
+
+
+@njit(cache=True)
+def _integrate(x, y, yaw, velocity, length, max_velocity, min_velocity,
+               acceleration, steering_angle, dt):
+    """
+    한 틱 동안의 차량 상태 적분 (스칼라 전용, numba 컴파일 가능)
+
+    Returns:
+        tuple: (x, y, yaw, velocity) - 적분된 새 상태
+    """
+    # 최대 및 최소 속도 도달 시간 계산
+    if acceleration > 0:  # 가속 중
+        t_max = (max_velocity - velocity) / acceleration
+    elif acceleration < 0:  # 감속 중
+        t_max = (min_velocity - velocity) / acceleration
+    else:  # 가속도 0
+        t_max = math.inf
+
+    # 두 가지 경우를 나눠 계산
+    if dt <= t_max:  # 최대/최저 속도에 도달하지 않음
+        v_end = velocity + acceleration * dt
+
+        accel_distance = velocity * dt + 0.5 * acceleration * dt**2
+        delta_yaw = accel_distance / length * math.tan(steering_angle)
+        avg_yaw = yaw + delta_yaw / 2
+
+        delta_x = accel_distance * math.cos(avg_yaw)
+        delta_y = accel_distance * math.sin(avg_yaw)
+
+    else:  # 최대/최저 속도에 도달한 이후 일정 속도로 이동
+        if acceleration > 0:
+            v_end = max_velocity
+        else:
+            v_end = min_velocity
+
+        # 나머지 시간 및 거리 계산
+        remaining_time = dt - t_max
+        constant_distance = v_end * remaining_time
+
+        # t_max 동안 가속/감속, 나머지 시간 일정 속도 유지
+        accel_distance = velocity * t_max + 0.5 * acceleration * t_max**2
+        delta_yaw = (accel_distance + constant_distance) / length * math.tan(steering_angle)
+        avg_yaw = yaw + delta_yaw / 2
+
+        delta_x = accel_distance * math.cos(avg_yaw) + constant_distance * math.cos(yaw + delta_yaw)
+        delta_y = accel_distance * math.sin(avg_yaw) + constant_distance * math.sin(yaw + delta_yaw)
+
+    return x + delta_x, y + delta_y, yaw + delta_yaw, v_end
+
+
 class RobotModel:
     
-    def __init__(self, config_path):
+    def __init__(self, config):
         """
         로봇 모델 초기화
         
         Args:
-            config_path (str): 설정 파일 경로
+            config (dict or str): 설정 dict 또는 설정 파일 경로
         """
-        # 설정 파일 로드
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # 경로가 넘어온 경우에만 파일에서 로드 (하위 호환)
+        if isinstance(config, str):
+            with open(config, 'r') as f:
+                config = json.load(f)
         
         vehicle_config = config['vehicle']
         start_point = config['start_point']
@@ -42,52 +97,18 @@ class RobotModel:
             steering_angle (float): 앞바퀴의 조향 각도 [rad]
             dt (float): 상태를 업데이트할 시간 간격 [s]
         """
-        # 가속도와 조향각 제한
-        acceleration = np.clip(acceleration, -self.max_acceleration, self.max_acceleration)
-        steering_angle = np.clip(steering_angle, -self.max_steering_angle, self.max_steering_angle)
-        
-        # 최대 및 최소 속도 도달 시간 계산
-        if acceleration > 0:  # 가속 중
-            t_max = (self.max_velocity - self.velocity) / acceleration
-        elif acceleration < 0:  # 감속 중
-            t_max = (self.min_velocity - self.velocity) / acceleration
-        else:  # 가속도 0
-            t_max = np.inf
-        
-        # 두 가지 경우를 나눠 계산
-        if dt <= t_max:  # 최대/최저 속도에 도달하지 않음
-            v_end = self.velocity + acceleration * dt
-            
-            accel_distance = self.velocity * dt + 0.5 * acceleration * dt**2
-            delta_yaw = accel_distance / self.length * np.tan(steering_angle)
-            avg_yaw = self.yaw + delta_yaw / 2
-            
-            delta_x = accel_distance * np.cos(avg_yaw)
-            delta_y = accel_distance * np.sin(avg_yaw)
-            
-        else:  # 최대/최저 속도에 도달한 이후 일정 속도로 이동
-            if acceleration > 0:
-                v_end = self.max_velocity
-            else:
-                v_end = self.min_velocity
-
-            # 나머지 시간 및 거리 계산
-            remaining_time = dt - t_max
-            constant_distance = v_end * remaining_time
-            
-            # t_max 동안 가속/감속, 나머지 시간 일정 속도 유지
-            accel_distance = self.velocity * t_max + 0.5 * acceleration * t_max**2
-            delta_yaw = (accel_distance + constant_distance) / self.length * np.tan(steering_angle)
-            avg_yaw = self.yaw + delta_yaw / 2
-
-            delta_x = accel_distance * np.cos(avg_yaw) + constant_distance * np.cos(self.yaw + delta_yaw)
-            delta_y = accel_distance * np.sin(avg_yaw) + constant_distance * np.sin(self.yaw + delta_yaw)
-
-        # 상태 업데이트
-        self.velocity = v_end
-        self.yaw += delta_yaw
-        self.x += delta_x
-        self.y += delta_y
+        # 가속도와 조향각 제한 (스칼라 min/max가 np.clip 디스패치보다 저렴)
+        a_max = self.max_acceleration
+        s_max = self.max_steering_angle
+        acceleration = float(min(max(acceleration, -a_max), a_max))
+        steering_angle = float(min(max(steering_angle, -s_max), s_max))
+
+        # 상태 적분 (컴파일된 스칼라 커널)
+        self.x, self.y, self.yaw, self.velocity = _integrate(
+            self.x, self.y, self.yaw, self.velocity,
+            self.length, self.max_velocity, self.min_velocity,
+            acceleration, steering_angle, float(dt)
+        )
     
     def get_state(self):
         """
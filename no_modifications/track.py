@@ -4,33 +4,42 @@ import json
 import os
 
 class Track:
-    def __init__(self, config_path):
+    def __init__(self, config):
         """
         트랙 클래스 초기화
         
         Args:p
-            config_path (str): 설정 파일 경로
+            config (dict or str): 설정 dict 또는 설정 파일 경로
         """
-        # 설정 파일 로드
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # 경로가 넘어온 경우에만 파일에서 로드 (하위 호환)
+        if isinstance(config, str):
+            with open(config, 'r') as f:
+                config = json.load(f)
         
         # 설정값 저장
         self.track_path = os.path.join('maps', config['map_name'])
         self.threshold = config['threshold']
         self.obstacle_above_threshold = config['obstacle_above_threshold']
-        self.resolution = 1.0  # 1 픽셀 = 1 미터
+        self.load_scale = config.get('load_scale', 1)  # 디코딩 시 축소 배율 (1/2/4/8)
+        if self.load_scale not in (1, 2, 4, 8):
+            raise ValueError("load_scale은 1, 2, 4, 8 중 하나여야 합니다.")
+        self.resolution = float(self.load_scale)  # 1 픽셀 = load_scale 미터
+        self._inv_res = 1.0 / self.resolution  # 반복 변환 시 나눗셈 대신 곱셈 사용
         
         # 맵 관련 변수들
-        self.obstacle_map = None
+        self.obstacle_map = None  # 압축 해제본 캐시 (필요할 때 생성)
+        self._packed = None  # 비트 단위로 압축된 장애물 맵
+        self._shape = None
         self.width_px = None
         self.height_px = None
         self.width_m = None
         self.height_m = None
         
-        # 시작점과 목표점 설정
-        start = (config['start_point']['x'], config['start_point']['y'])
-        goal = (config['goal_point']['x'], config['goal_point']['y'])
+        # 시작점과 목표점 설정 (설정값은 원본 해상도 기준이므로 배율로 환산)
+        start = (config['start_point']['x'] // self.load_scale,
+                 config['start_point']['y'] // self.load_scale)
+        goal = (config['goal_point']['x'] // self.load_scale,
+                config['goal_point']['y'] // self.load_scale)
         
         # 초기 맵 로드 및 변환
         self._load_map()
@@ -42,110 +51,147 @@ class Track:
     def _load_map(self):
         """맵 이미지 로드 및 초기화"""
         # OpenCV를 사용하여 이미지 읽기
-        img = cv2.imread(self.track_path, cv2.IMREAD_GRAYSCALE)
+        # load_scale > 1이면 디코딩 단계에서 바로 축소해 리사이즈 패스를 생략
+        imread_flags = {
+            1: cv2.IMREAD_GRAYSCALE,
+            2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+            4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+            8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+        }
+        img = cv2.imread(self.track_path, imread_flags[self.load_scale])
         
         # 이진화 (obstacle_above_threshold에 따라 장애물 설정)
-        if self.obstacle_above_threshold:
-            self.obstacle_map = (img > self.threshold).astype(np.int8)
-        else:
-            self.obstacle_map = (img <= self.threshold).astype(np.int8)
-        
+        # cv2.threshold는 SIMD 최적화된 단일 패스로 uint8 결과를 바로 생성
+        thresh_type = (cv2.THRESH_BINARY if self.obstacle_above_threshold
+                       else cv2.THRESH_BINARY_INV)
+        _, binary = cv2.threshold(img, self.threshold, 1, thresh_type)
+
+        # 0/1 맵이므로 비트 단위로 압축 저장 (메모리 8배 절감)
+        self._shape = binary.shape
+        self._packed = np.packbits(binary.ravel())
+        self.obstacle_map = None  # 압축 해제본은 get_obstacle_map에서 lazy 생성
+
         # 맵의 크기 저장
-        self.height_px, self.width_px = self.obstacle_map.shape
+        self.height_px, self.width_px = self._shape
         self.width_m = self.width_px * self.resolution
         self.height_m = self.height_px * self.resolution
     
     def image_to_xy_pixel(self, image_pixel):
         """이미지 픽셀 좌표를 xy 픽셀 좌표로 변환"""
-        image_pixel = np.array(image_pixel)
-        return image_pixel
-    
+        # 이미 ndarray인 입력은 복사 없이 그대로 사용
+        return np.asarray(image_pixel)
+
     def xy_pixel_to_image(self, xy_pixel):
         """xy 픽셀 좌표를 이미지 픽셀 좌표로 변환"""
-        xy_pixel = np.array(xy_pixel)
-        return xy_pixel
-    
+        return np.asarray(xy_pixel)
+
     def pixel_to_xy(self, pixel_coord):
         """픽셀 좌표를 xy 좌표계(미터)로 변환"""
-        pixel_coord = np.array(pixel_coord)
+        if self.resolution == 1.0:
+            # 1픽셀 = 1미터면 스케일 곱이 불필요
+            return np.asarray(pixel_coord, dtype=np.float64)
         xy_pixel = self.image_to_xy_pixel(pixel_coord)
         return xy_pixel * self.resolution
-    
+
     def xy_to_pixel(self, xy_coord):
-        """xy 좌표(미터)를 픽셀 좌표로 변환"""
-        xy_coord = np.array(xy_coord)
-        px = (xy_coord / self.resolution).astype(int)
-        return self.xy_pixel_to_image(px)
+        """
+        xy 좌표(미터)를 픽셀 좌표로 변환
+
+        단일 좌표 (2,)와 좌표 배열 (N, 2) 모두 브로드캐스팅으로 처리합니다.
+        """
+        arr = np.asarray(xy_coord)
+        if self.resolution == 1.0:
+            return arr.astype(np.int32, copy=False)
+        return (arr * self._inv_res).astype(np.int32)
     
+    def _is_obstacle(self, x, y):
+        """압축된 비트맵에서 (x, y) 픽셀의 장애물 여부를 비트 연산으로 확인"""
+        idx = int(y) * self.width_px + int(x)
+        return (self._packed[idx >> 3] >> (7 - (idx & 7))) & 1
+
     def set_start_point(self, pixel_coord):
         """시작점 설정"""
-        pixel_coord = np.array(pixel_coord)
-        xy_pixel = self.image_to_xy_pixel(pixel_coord)
-        if self.obstacle_map[xy_pixel[1], xy_pixel[0]] == 1:
-            raise ValueError(f"시작점 위치 ({pixel_coord[0]}, {pixel_coord[1]})는 장애물 영역입니다.")
-            
-        self.start = pixel_coord
+        # 단일 픽셀 검사에는 ndarray 변환이 불필요 (스칼라 인덱스로 검증)
+        x, y = int(pixel_coord[0]), int(pixel_coord[1])
+        if self._is_obstacle(x, y) == 1:
+            raise ValueError(f"시작점 위치 ({x}, {y})는 장애물 영역입니다.")
+
+        self.start = np.asarray(pixel_coord)
+        self._start_tuple = (x, y)  # 핫패스용 (ndarray 인덱싱/언박싱 회피)
         self.start_xy = self.pixel_to_xy(pixel_coord)
-    
+
     def set_goal_point(self, pixel_coord):
         """도착점 설정"""
-        pixel_coord = np.array(pixel_coord)
-        xy_pixel = self.image_to_xy_pixel(pixel_coord)
-        if self.obstacle_map[xy_pixel[1], xy_pixel[0]] == 1:
-            raise ValueError(f"도착점 위치 ({pixel_coord[0]}, {pixel_coord[1]})는 장애물 영역입니다.")
-            
-        self.goal = pixel_coord
+        x, y = int(pixel_coord[0]), int(pixel_coord[1])
+        if self._is_obstacle(x, y) == 1:
+            raise ValueError(f"도착점 위치 ({x}, {y})는 장애물 영역입니다.")
+
+        self.goal = np.asarray(pixel_coord)
+        self._goal_tuple = (x, y)
         self.goal_xy = self.pixel_to_xy(pixel_coord)
     
     def get_map_extent(self):
         """맵의 실제 크기 범위를 반환 (미터 단위)"""
         return [0, self.width_m, 0, self.height_m]
     
-    def get_obstacle_map(self):
+    def get_obstacle_map(self, read_only=False):
         """
         장애물 맵을 반환
-        
+
+        Args:
+            read_only (bool): True면 복사 대신 쓰기 금지 뷰를 반환 (읽기 전용 소비자용)
+
         Returns:
             numpy.ndarray: 장애물 맵 (0: 주행가능, 1: 장애물)
             shape: (height_px, width_px)
         """
-        if self.obstacle_map is None:
+        if self._packed is None:
             raise ValueError("장애물 맵이 초기화되지 않았습니다.")
+        if self.obstacle_map is None:
+            h, w = self._shape
+            self.obstacle_map = np.unpackbits(self._packed)[:h * w] \
+                .reshape(self._shape)
+        if read_only:
+            view = self.obstacle_map.view()
+            view.setflags(write=False)
+            return view
         return self.obstacle_map.copy()
     
-    def get_start_point(self, coord_type='pixel'):
+    def get_start_point(self, coord_type='pixel', as_array=False):
         """
         시작점 좌표를 반환
-        
+
         Args:
             coord_type (str): 반환할 좌표 타입 ('pixel' 또는 'xy')
-        
+            as_array (bool): True면 'pixel'도 ndarray로 반환
+
         Returns:
-            numpy.ndarray: 시작점 좌표
-                - coord_type='pixel': 이미지 픽셀 좌표 (shape: (2,))
+            tuple 또는 numpy.ndarray: 시작점 좌표
+                - coord_type='pixel': 이미지 픽셀 좌표 (기본은 int tuple)
                 - coord_type='xy': 실제 좌표 [m] (shape: (2,))
         """
         if coord_type == 'pixel':
-            return self.start
+            return self.start if as_array else self._start_tuple
         elif coord_type == 'xy':
             return self.start_xy
         else:
             raise ValueError("coord_type은 'pixel' 또는 'xy'여야 합니다.")
-    
-    def get_goal_point(self, coord_type='pixel'):
+
+    def get_goal_point(self, coord_type='pixel', as_array=False):
         """
         목표점 좌표를 반환
-        
+
         Args:
             coord_type (str): 반환할 좌표 타입 ('pixel' 또는 'xy')
-        
+            as_array (bool): True면 'pixel'도 ndarray로 반환
+
         Returns:
-            numpy.ndarray: 목표점 좌표
-                - coord_type='pixel': 이미지 픽셀 좌표 (shape: (2,))
+            tuple 또는 numpy.ndarray: 목표점 좌표
+                - coord_type='pixel': 이미지 픽셀 좌표 (기본은 int tuple)
                 - coord_type='xy': 실제 좌표 [m] (shape: (2,))
         """
         if coord_type == 'pixel':
-            return self.goal
+            return self.goal if as_array else self._goal_tuple
         elif coord_type == 'xy':
             return self.goal_xy
         else:
@@ -160,11 +206,11 @@ class Track:
         
         Returns:
             tuple: (시작점 좌표, 목표점 좌표)
-                - coord_type='pixel': 이미지 픽셀 좌표 (각각 shape: (2,))
+                - coord_type='pixel': 이미지 픽셀 좌표 (각각 int tuple)
                 - coord_type='xy': 실제 좌표 [m] (각각 shape: (2,))
         """
         if coord_type == 'pixel':
-            return self.start, self.goal
+            return self._start_tuple, self._goal_tuple
         elif coord_type == 'xy':
             return self.start_xy, self.goal_xy
         else:
@@ -1,140 +1,307 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Rectangle, Polygon
 
 class Visualizer:
+    # 차량 로컬 좌표계의 네 모서리 (앞왼쪽, 앞오른쪽, 뒤오른쪽, 뒤왼쪽)
+    _CORNERS_BASE = np.array([[0.5, 0.5], [0.5, -0.5], [-0.5, -0.5], [-0.5, 0.5]])
+
     def __init__(self, figsize=(10, 10)):
         """
         시각화 클래스 초기화
-        
+
         Args:
             figsize (tuple): matplotlib figure 크기
         """
+        # matplotlib은 로드 비용이 크므로 (수백 ms, 수십 MB) 실제 사용 시점에 임포트
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Polygon, FancyArrowPatch
+        self._plt = plt
+        self._Polygon = Polygon
+        self._FancyArrowPatch = FancyArrowPatch
+
         self.fig = plt.figure(figsize=figsize)
+        self.ax = self.fig.add_subplot(111)
         self.visualization_counter = 0
-        self.car_positions_x = []
-        self.car_positions_y = []
+        self._traj = np.empty((1024, 2), np.float32)  # 차량 궤적 버퍼 (필요 시 2배 확장)
+        self._n = 0  # 기록된 궤적 점 개수
         self.collision_point = None  # 충돌 지점 저장용
-        
+        self._static_drawn = False  # 정적 배경(맵/경로/시작/목표) 드로잉 여부
+        self._dynamic_artists = []  # 매 프레임 교체되는 아티스트들
+        # 재사용할 Line2D 아티스트들 (프레임마다 set_data로 좌표만 갱신)
+        self._path_line, = self.ax.plot([], [], 'b-', label='Planned Path')
+        self._start_marker, = self.ax.plot([], [], 'go', label='Start')
+        self._goal_marker, = self.ax.plot([], [], 'ro', label='Goal')
+        self._traj_line, = self.ax.plot([], [], 'm--', alpha=0.5, label='Car Trajectory')
+        # 블리팅 대상(매 프레임 갱신되는 아티스트)은 배경 스냅숏에서 제외
+        self._traj_line.set_animated(True)
+        self.ax.title.set_animated(True)
+        self._bg = None  # 정적 배경 스냅숏 (copy_from_bbox 결과)
+        self._car_poly = None  # 재사용할 차량 폴리곤 (첫 draw_car에서 생성)
+        self._car_arrow = None  # 재사용할 진행 방향 화살표
+        self._img_artist = None  # 장애물 맵 AxesImage (재업로드 방지용 캐시)
+        self._map_id = None  # 현재 표시 중인 맵 객체 식별자
+        self._path_id = None  # 캐시된 경로 객체 식별자
+        self._path_f32 = None  # 경로의 연속(float32) 사본
+        self._path_x = None
+        self._path_y = None
+        self._last_closest_idx = 0  # 직전 프레임의 최근접 경로 인덱스
+        self._no_progress_frames = 0  # 진행률이 멈춘 프레임 수 (전역 재탐색 트리거)
+
     def update_car_position(self, x, y):
-        """차량 위치 기록 업데이트"""
-        self.car_positions_x.append(x)
-        self.car_positions_y.append(y)
-        
+        """차량 위치 기록 업데이트 (버퍼가 가득 차면 용량을 2배로 확장)"""
+        if self._n == len(self._traj):
+            grown = np.empty((len(self._traj) * 2, 2), np.float32)
+            grown[:self._n] = self._traj
+            self._traj = grown
+        self._traj[self._n, 0] = x
+        self._traj[self._n, 1] = y
+        self._n += 1
+
     def set_collision_point(self, x, y):
         """충돌 지점 설정"""
         self.collision_point = (x, y)
-        
+
     def draw_car(self, car):
         """직사각형 모양의 자동차 그리기"""
-        # 차량의 네 모서리 좌표 계산
+        # 자주 쓰는 속성은 지역 변수로 한 번만 조회
+        cx, cy = car.x, car.y
+        hl = car.length * 0.5
+        hw = car.width * 0.5
+
+        # 차량의 네 모서리 좌표 계산 (회전 행렬 한 번의 matmul로 처리)
         cos_yaw = np.cos(car.yaw)
         sin_yaw = np.sin(car.yaw)
-        
-        corners = [
-            # 앞쪽 왼쪽
-            (car.x + cos_yaw * car.length/2 - sin_yaw * car.width/2,
-             car.y + sin_yaw * car.length/2 + cos_yaw * car.width/2),
-            # 앞쪽 오른쪽
-            (car.x + cos_yaw * car.length/2 + sin_yaw * car.width/2,
-             car.y + sin_yaw * car.length/2 - cos_yaw * car.width/2),
-            # 뒤쪽 오른쪽
-            (car.x - cos_yaw * car.length/2 + sin_yaw * car.width/2,
-             car.y - sin_yaw * car.length/2 - cos_yaw * car.width/2),
-            # 뒤쪽 왼쪽
-            (car.x - cos_yaw * car.length/2 - sin_yaw * car.width/2,
-             car.y - sin_yaw * car.length/2 + cos_yaw * car.width/2)
-        ]
-        
-        # 차량 본체 그리기 (직사각형)
-        car_polygon = Polygon(corners, color='magenta', alpha=0.5, label='Car')
-        plt.gca().add_patch(car_polygon)
-        
+
+        R = np.array([[cos_yaw, -sin_yaw], [sin_yaw, cos_yaw]])
+        extent = np.array([hl * 2.0, hw * 2.0])
+        corners = (self._CORNERS_BASE * extent) @ R.T + np.array([cx, cy])
+
+        # 차량 본체와 방향 화살표는 한 번만 만들고 이후에는 좌표만 갱신
+        if self._car_poly is None:
+            self._car_poly = self._Polygon(corners, color='magenta', alpha=0.5, label='Car')
+            self._car_poly.set_animated(True)
+            self.ax.add_patch(self._car_poly)
+
+            self._car_arrow = self._FancyArrowPatch((0, 0), (0, 0), color='red',
+                                                    arrowstyle='-|>', mutation_scale=15)
+            self._car_arrow.set_animated(True)
+            self.ax.add_patch(self._car_arrow)
+        else:
+            self._car_poly.set_xy(corners)
+
         # 차량 진행 방향 표시 (화살표)
-        front_center = (
-            car.x + cos_yaw * car.length/2,
-            car.y + sin_yaw * car.length/2
-        )
-        direction_len = car.length/2
-        plt.arrow(car.x, car.y,
-                 direction_len * cos_yaw,
-                 direction_len * sin_yaw,
-                 head_width=car.width/4, color='red')
-        
+        self._car_arrow.set_positions((cx, cy),
+                                      (cx + hl * cos_yaw, cy + hl * sin_yaw))
+
     def find_closest_path_point(self, car_pos, path):
         """
         현재 차량 위치에서 가장 가까운 경로 점의 인덱스를 찾습니다.
-        
+
         Args:
             car_pos (tuple): 차량의 현재 위치 (x, y)
             path (numpy.ndarray): 경로 점들의 배열
-        
+
         Returns:
             int: 가장 가까운 경로 점의 인덱스
         """
-        distances = np.sqrt(np.sum((path - np.array(car_pos))**2, axis=1))
-        return np.argmin(distances)
+        # argmin에는 sqrt가 필요 없으므로 성분별 제곱 거리로 비교
+        return int(np.argmin(self._squared_distances(car_pos, path)))
+
+    @staticmethod
+    def _squared_distances(car_pos, path):
+        """경로의 각 점까지의 제곱 거리 배열을 반환 (sqrt 없음)"""
+        dx = path[:, 0] - car_pos[0]
+        dy = path[:, 1] - car_pos[1]
+        return dx * dx + dy * dy
+
+    def closest_with_distance(self, car_pos, path):
+        """
+        가장 가까운 경로 점의 인덱스와 실제 거리를 함께 반환
+
+        순서 비교만 제곱 거리로 수행하고 sqrt는 선택된 한 점에만 적용합니다.
+
+        Returns:
+            tuple: (인덱스, 거리)
+        """
+        d_sq = self._squared_distances(car_pos, path)
+        idx = int(np.argmin(d_sq))
+        return idx, float(np.sqrt(d_sq[idx]))
+
+    def _find_closest_windowed(self, car_pos, path):
+        """
+        직전 프레임의 최근접 인덱스 주변만 탐색하는 버전
+
+        차량은 경로를 따라 단조롭게 진행하므로 전체 O(N) 탐색 대신
+        [last-16, last+64] 윈도우만 검사하고, 여러 프레임 동안 진행이
+        없으면 전체 탐색으로 복구합니다.
+        """
+        lo = max(0, self._last_closest_idx - 16)
+        hi = min(len(path), self._last_closest_idx + 64)
+        closest_idx = lo + self.find_closest_path_point(car_pos, path[lo:hi])
+
+        if closest_idx > self._last_closest_idx:
+            self._no_progress_frames = 0
+        else:
+            self._no_progress_frames += 1
+            if self._no_progress_frames > 10:
+                # 윈도우 밖으로 벗어났을 가능성: 전체 경로에서 재탐색
+                closest_idx = self.find_closest_path_point(car_pos, path)
+                self._no_progress_frames = 0
+
+        self._last_closest_idx = closest_idx
+        return closest_idx
+
+    def _draw_static_background(self, path, obstacle_map, start, goal):
+        """맵/계획 경로/시작점/목표점은 바뀌지 않으므로 한 번만 그림"""
+        # 트랙 표시 (이미지 그대로 표시, origin='upper'로 설정)
+        # AxesImage를 캐시해 두면 렌더러로의 텍스처 재업로드가 발생하지 않음
+        self._img_artist = self.ax.imshow(obstacle_map, cmap='gray', origin='upper')
+        self._map_id = id(obstacle_map)
+
+        # 경로 표시 (y좌표 변환 없이 그대로 사용)
+        self._path_line.set_data(self._path_x, self._path_y)
+
+        # 시작점과 목표점 표시 (y좌표 변환 없이 그대로 사용)
+        self._start_marker.set_data([start[0]], [start[1]])
+        self._goal_marker.set_data([goal[0]], [goal[1]])
+
+        self._static_drawn = True
 
     def visualize(self, car, path, obstacle_map, start, goal, distance_to_goal, simulation_time, update_interval=5, force_progress=None, goal_radius=None):
         """
         시뮬레이션 상태 시각화
-        
+
+        정적 배경은 첫 프레임에만 그리고, 이후에는 동적 아티스트(차량,
+        궤적, 충돌 표시)만 교체하여 전체 재드로잉 비용을 줄입니다.
+
         Args:
             force_progress (float, optional): 강제로 설정할 진행률. None이면 계산된 값 사용
             goal_radius (float, optional): 목표 도달 판정 거리
         """
         if self.visualization_counter % update_interval == 0:
-            plt.clf()
-            
-            # 트랙 표시 (이미지 그대로 표시, origin='upper'로 설정)
-            plt.imshow(obstacle_map, cmap='gray', origin='upper')
-            
-            # 경로 표시 (y좌표 변환 없이 그대로 사용)
-            plt.plot(path[:, 0], path[:, 1], 'b-', label='Planned Path')
-            
-            # 차량 궤적 표시 (y좌표 변환 없이 그대로 사용)
-            plt.plot(self.car_positions_x, self.car_positions_y, 'm--', 
-                    label='Car Trajectory', alpha=0.5)
-            
-            # 시작점과 목표점 표시 (y좌표 변환 없이 그대로 사용)
-            plt.plot(start[0], start[1], 'go', label='Start')
-            plt.plot(goal[0], goal[1], 'ro', label='Goal')
-            
+            # 경로는 시뮬레이션 내내 고정이므로 연속 float32로 한 번만 변환
+            if self._path_id != id(path):
+                self._path_f32 = np.ascontiguousarray(path, dtype=np.float32)
+                self._path_x = self._path_f32[:, 0]
+                self._path_y = self._path_f32[:, 1]
+                self._path_id = id(path)
+
+            first_frame = not self._static_drawn
+            if first_frame:
+                self._draw_static_background(path, obstacle_map, start, goal)
+            elif id(obstacle_map) != self._map_id:
+                # 맵 객체가 바뀐 경우에만 이미지 데이터를 갱신 (일반적으로 발생하지 않음)
+                self._img_artist.set_data(obstacle_map)
+                self._map_id = id(obstacle_map)
+
+            # 직전 프레임의 동적 아티스트 제거
+            for artist in self._dynamic_artists:
+                artist.remove()
+            self._dynamic_artists.clear()
+
+            # 차량 궤적 표시 (아티스트는 재사용하고 좌표만 갱신)
+            self._traj_line.set_data(self._traj[:self._n, 0], self._traj[:self._n, 1])
+
             # 차량 그리기 (y좌표 변환 없이 그대로 사용)
             self.draw_car(car)
-            
+
             # 현재 경로 진행률 계산
             if force_progress is not None:
                 progress_percentage = force_progress
             else:
-                closest_idx = self.find_closest_path_point((car.x, car.y), path)
+                closest_idx = self._find_closest_windowed((car.x, car.y), self._path_f32)
                 progress_percentage = (closest_idx / (len(path) - 1)) * 100
-            
+
             # 충돌 지점 표시 (y좌표 변환 없이 그대로 사용)
             if self.collision_point is not None:
                 collision_x, collision_y = self.collision_point
-                
-                plt.plot(collision_x, collision_y, 'rx', markersize=20, 
-                        markeredgewidth=3, label='Collision Point')
-                circle = plt.Circle((collision_x, collision_y), radius=5, 
+
+                marker, = self.ax.plot(collision_x, collision_y, 'rx', markersize=20,
+                                       markeredgewidth=3, label='Collision Point')
+                circle = self._plt.Circle((collision_x, collision_y), radius=5,
                                   color='red', fill=False, linewidth=2)
-                plt.gca().add_patch(circle)
-                plt.text(collision_x + 10, collision_y + 10, 'COLLISION!', 
-                        color='red', fontsize=15, fontweight='bold',
-                        bbox=dict(facecolor='white', edgecolor='red', alpha=0.7))
-            
+                self.ax.add_patch(circle)
+                text = self.ax.text(collision_x + 10, collision_y + 10, 'COLLISION!',
+                                    color='red', fontsize=15, fontweight='bold',
+                                    bbox=dict(facecolor='white', edgecolor='red', alpha=0.7))
+                for artist in (marker, circle, text):
+                    artist.set_animated(True)
+                self._dynamic_artists.extend([marker, circle, text])
+
             # 현재 상태 정보 표시 (시뮬레이션 시간, 진행률, 속도 추가)
             status = 'COLLISION!' if self.collision_point is not None else f'Distance to Goal: {distance_to_goal:.1f}m (<{goal_radius}m)'
-            plt.title(f'Time: {simulation_time:.1f}s | Progress: {progress_percentage:.1f}% | Velocity: {car.velocity:.1f}m/s\n{status}\n'
-                     f'Car Position: ({car.x:.1f}m, {car.y:.1f}m)\n'
-                     f'Yaw: {np.degrees(car.yaw):.1f}°',
-                     color='red' if self.collision_point is not None else 'black')
-            
-            plt.legend()
-            plt.pause(0.001)
-            
+            self.ax.set_title(f'Time: {simulation_time:.1f}s | Progress: {progress_percentage:.1f}% | Velocity: {car.velocity:.1f}m/s\n{status}\n'
+                              f'Car Position: ({car.x:.1f}m, {car.y:.1f}m)\n'
+                              f'Yaw: {np.degrees(car.yaw):.1f}°',
+                              color='red' if self.collision_point is not None else 'black')
+
+            if first_frame:
+                # 범례를 포함한 전체 드로잉 후 정적 배경을 스냅숏
+                # (animated 아티스트는 canvas.draw()에서 제외됨)
+                self.ax.legend()
+                self.fig.canvas.draw()
+                self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+            else:
+                self.fig.canvas.restore_region(self._bg)
+
+            # 동적 아티스트만 배경 위에 합성하고 해당 영역만 블리팅
+            self.ax.draw_artist(self._traj_line)
+            if self._car_poly is not None:
+                self.ax.draw_artist(self._car_poly)
+                self.ax.draw_artist(self._car_arrow)
+            for artist in self._dynamic_artists:
+                self.ax.draw_artist(artist)
+            self.ax.draw_artist(self.ax.title)
+            self.fig.canvas.blit(self.fig.bbox)
+            self.fig.canvas.flush_events()
+
         self.visualization_counter += 1
-    
+
     def show(self):
         """최종 결과 표시"""
-        plt.show() 
\ No newline at end of file
+        # 일반 드로잉에서도 보이도록 animated 플래그 해제
+        self._traj_line.set_animated(False)
+        self.ax.title.set_animated(False)
+        if self._car_poly is not None:
+            self._car_poly.set_animated(False)
+            self._car_arrow.set_animated(False)
+        for artist in self._dynamic_artists:
+            artist.set_animated(False)
+        self._plt.show()
+
+
+class NullVisualizer:
+    """
+    시각화를 끈 실행(벤치마크/헤드리스)용 no-op 시각화 클래스
+
+    Visualizer와 동일한 API를 제공하지만 matplotlib을 로드하지 않으며
+    아무것도 그리지 않습니다. 진행률 계산에 쓰이는 최근접 탐색만
+    실제로 수행합니다.
+    """
+
+    def __init__(self, figsize=(10, 10)):
+        self.collision_point = None
+
+    def update_car_position(self, x, y):
+        pass
+
+    def set_collision_point(self, x, y):
+        self.collision_point = (x, y)
+
+    def draw_car(self, car):
+        pass
+
+    def find_closest_path_point(self, car_pos, path):
+        return Visualizer.find_closest_path_point(self, car_pos, path)
+
+    def closest_with_distance(self, car_pos, path):
+        return Visualizer.closest_with_distance(self, car_pos, path)
+
+    _squared_distances = staticmethod(Visualizer._squared_distances)
+
+    def visualize(self, car, path, obstacle_map, start, goal, distance_to_goal,
+                  simulation_time, update_interval=5, force_progress=None,
+                  goal_radius=None):
+        pass
+
+    def show(self):
+        pass